@@ -1,48 +1,380 @@
-from playwright.sync_api import sync_playwright
+from __future__ import annotations
+
+import diskcache
+import httpx
+import argparse
+import asyncio
 import json
-import time
+import os
 import re
-from typing import List, Dict, Optional
-from urllib.parse import quote
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# playwrightは読み込みに時間がかかるため、Playwright版を使うときだけインポートする
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# "1.2k" のような件数表記の接尾辞と倍率
+_MULT = {'k': 1000, 'm': 1_000_000, 'b': 1_000_000_000}
+
+# "Python 85.2%" のような言語統計ラベルから言語名を抽出
+_LANG_RE = re.compile(r'^([^0-9]+)')
+
+# 検索結果のハイライト用タグ（<em>など）
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 検索結果ページに埋め込まれたJSONを取得（存在しない・解析できない場合はnull）
+_EMBEDDED_DATA_JS = """() => {
+    const script = document.querySelector('script[data-target="react-app.embeddedData"]');
+    if (!script) {
+        return null;
+    }
+    try {
+        return JSON.parse(script.textContent);
+    } catch (e) {
+        return null;
+    }
+}"""
+
+# 検索結果のリンク要素からURLとリポジトリ名を取得
+_SEARCH_LINKS_JS = """(links) => links.map(link => ({
+    href: link.getAttribute('href'),
+    name: link.innerText.trim()
+}))"""
+
+# リポジトリページの説明・言語・スター数・フォーク数・ライセンス表示を一度に取得
+# 各項目はセレクターを順に試し、最初に見つかった要素を使う
+_REPOSITORY_JS = """(selectors) => {
+    const first = (candidates) => {
+        for (const selector of candidates) {
+            const element = document.querySelector(selector);
+            if (element) {
+                return element;
+            }
+        }
+        return null;
+    };
+    const text = (element) => element ? element.innerText.trim() : null;
+    
+    const bar = document.querySelector(selectors.languageBar);
+    
+    let license = null;
+    for (const selector of selectors.license) {
+        const element = document.querySelector(selector);
+        if (element) {
+            const licenseText = element.innerText.trim();
+            if (licenseText && licenseText !== 'View license') {
+                license = {text: licenseText, href: element.getAttribute('href') || ''};
+                break;
+            }
+        }
+    }
+    
+    return {
+        description: text(first(selectors.description)),
+        language: {
+            label: bar ? bar.getAttribute('aria-label') : null,
+            text: text(document.querySelector(selectors.languageText))
+        },
+        stars: text(first(selectors.stars)),
+        forks: text(first(selectors.forks)),
+        license: license
+    };
+}"""
+
+class BaseLicenseChecker(ABC):
+    """検索・表示・出力の共通処理を持つ基底クラス"""
+    
+    label = ""
+    report_filename = "github_license_report.json"
+    
+    def __init__(self, output: Optional[str] = None):
+        """
+        Args:
+            output: 取得した結果を1件ずつ書き出すJSONLファイル（実行ごとに上書き）
+        """
+        self.output = output
+        self._out = None
+        self._written = set()
+    
+    def _open_output(self):
+        """JSONL出力ファイルを開く（実行ごとに新しく作成し、前回の結果は残さない）"""
+        if self.output:
+            self._out = open(self.output, 'w', encoding='utf-8')
+            self._written.clear()
+    
+    def _close_output(self):
+        """JSONL出力ファイルを閉じる"""
+        if self._out:
+            self._out.close()
+            self._out = None
+    
+    def _write_result(self, repo_info: Dict):
+        """取得できたリポジトリ情報をJSONLファイルへ1行追記（同じ実行内で重複するリポジトリは1回だけ）"""
+        if not self._out or repo_info["repository"] in self._written:
+            return
+        self._written.add(repo_info["repository"])
+        if orjson:
+            line = orjson.dumps(repo_info).decode('utf-8')
+        else:
+            line = json.dumps(repo_info, ensure_ascii=False)
+        self._out.write(line + '\n')
+        self._out.flush()
+    
+    @abstractmethod
+    async def search_repositories(self, keyword: str, sort: str = "stars", count: int = 10) -> List[Dict]:
+        """リポジトリを検索し詳細情報のリストを返す（サブクラスで実装）"""
+    
+    async def check_repositories_licenses(self, keyword: str, count: int = 10, sort: str = "stars") -> List[Dict]:
+        """
+        キーワードで検索したリポジトリのライセンスをチェック
+        
+        Args:
+            keyword: 検索キーワード
+            count: チェックするリポジトリ数
+            sort: ソート方法
+        
+        Returns:
+            リポジトリとライセンス情報のリスト
+        """
+        return await self.search_repositories(keyword, sort, count)
+    
+    def display_results(self, results: List[Dict]):
+        """結果を見やすく表示"""
+        if not results:
+            print("表示する結果がありません。")
+            return
+        
+        print("\n" + "="*80)
+        print(f"GitHub リポジトリ ライセンス チェック結果 ({self.label})")
+        print("="*80)
+        
+        for i, result in enumerate(results, 1):
+            print(f"\n{i}. {result['repository']}")
+            print(f"   説明: {result['description'][:100]}{'...' if len(result['description']) > 100 else ''}")
+            print(f"   言語: {result['language']}")
+            print(f"   スター: {result['stars']:,} | フォーク: {result['forks']:,}")
+            print(f"   ライセンス: {result['license']['name']}")
+            print(f"   URL: {result['url']}")
+            
+            if result['license']['key'] == 'no-license':
+                print("   ⚠️  ライセンスが設定されていません")
+            elif result['license']['key'] == 'error':
+                print("   ❌ ライセンス情報の取得に失敗しました")
+    
+    def export_to_json(self, results: List[Dict], filename: Optional[str] = None):
+        """結果をJSONファイルに出力"""
+        filename = filename or self.report_filename
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            print(f"\n結果を {filename} に保存しました。")
+        except Exception as e:
+            print(f"ファイル保存エラー: {e}")
 
-class GitHubLicenseChecker:
-    def __init__(self, headless: bool = True, slow_mo: int = 100):
+class GitHubLicenseChecker(BaseLicenseChecker):
+    label = "Playwright版"
+    report_filename = "github_license_report_playwright.json"
+    
+    DEFAULT_CACHE_DIR = "~/.ghlc_cache"
+    
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    VIEWPORT = {"width": 1024, "height": 768}
+    
+    # 使用しないGPU・拡張機能・バックグラウンド通信などを無効化する起動オプション
+    LAUNCH_ARGS = [
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--mute-audio",
+        "--blink-settings=imagesEnabled=false",
+        "--disable-features=Translate,BackForwardCache",
+    ]
+    
+    # リポジトリページの各項目を探すセレクター（先頭から順に試す）
+    SELECTORS = {
+        "description": ['[data-pjax="#repo-content-pjax-container"] p'],
+        "languageBar": '[data-view-component="true"] .Progress-item',
+        "languageText": '[data-view-component="true"] .ml-0 .color-fg-default',
+        "stars": [
+            '#repo-stars-counter-star',
+            '[data-view-component="true"] #repo-stars-counter-star',
+            'a[href$="/stargazers"] strong',
+            '.js-social-count'
+        ],
+        "forks": [
+            '#repo-network-counter',
+            '[data-view-component="true"] #repo-network-counter',
+            'a[href$="/forks"] strong'
+        ],
+        "license": [
+            '[data-view-component="true"] .Link--muted[href*="license"]',
+            '.octicon-law + .Link--muted',
+            'a[href$="/blob/main/LICENSE"]',
+            'a[href$="/blob/master/LICENSE"]',
+            '.BorderGrid-cell .octicon-law + *'
+        ],
+    }
+    
+    # ライセンス表示がない場合に存在を確認するファイル
+    LICENSE_FILES = ['LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING']
+    RAW_URL = "https://raw.githubusercontent.com"
+    
+    # テキスト抽出に不要なためブロックするリソース
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+    BLOCKED_URL_PREFIXES = (
+        "https://collector.github.com/",
+        "https://api.github.com/_private/browser/stats",
+    )
+    
+    def __init__(self, headless: bool = True, slow_mo: int = 0, concurrency: int = 5,
+                 max_age: int = 86400, cache_dir: str = DEFAULT_CACHE_DIR,
+                 output: Optional[str] = None, proxies: Optional[List[str]] = None):
         """
         PlaywrightでGitHubリポジトリのライセンスをチェックするクラス
         
         Args:
             headless: ヘッドレスモードで実行するか
-            slow_mo: 操作間の待機時間（ミリ秒）
+            slow_mo: 操作間の待機時間（ミリ秒、画面で動作を確認するデバッグ用）
+            concurrency: 並列に開くページ数（プロキシを指定した場合はプロキシごと）
+            max_age: 取得結果をキャッシュから再利用する期間（秒、0でキャッシュ無効）
+            cache_dir: キャッシュを保存するディレクトリ
+            output: 取得した結果を1件ずつ書き出すJSONLファイル（実行ごとに上書き）
+            proxies: 使用するプロキシサーバーのリスト（"http://host:port" 形式、プロキシごとにコンテキストを作成）
         """
+        super().__init__(output)
         self.headless = headless
         self.slow_mo = slow_mo
+        self.concurrency = max(1, concurrency)
+        self.max_age = max_age
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.cache: Optional[diskcache.Cache] = None
+        # 実行中に取得したリポジトリ（複数キーワードで重複するリポジトリの再取得を防ぐ）
+        self._repo_cache: Dict[str, asyncio.Task] = {}
+        self.playwright = None
         self.browser = None
-        self.page = None
-    
-    def __enter__(self):
-        """コンテキストマネージャーのエントリ"""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless, 
-            slow_mo=self.slow_mo
-        )
-        self.page = self.browser.new_page()
+        self.proxies = proxies or []
+        self.contexts = []
+        self.pages: List[Page] = []
+        self.page_queue: Optional[asyncio.Queue] = None
+        self.http_clients: List[httpx.AsyncClient] = []
+        # playwright.async_api.Error（__aenter__ でインポート）
+        self._playwright_error = None
+        # ページごとに、そのページと同じプロキシを使うHTTPクライアント
+        self._page_clients: Dict[Page, httpx.AsyncClient] = {}
+    
+    async def __aenter__(self):
+        """非同期コンテキストマネージャーのエントリ"""
+        try:
+            from playwright.async_api import async_playwright, Error as PlaywrightError
+        except ImportError as e:
+            raise ImportError(
+                "Playwright版を使うには playwright が必要です "
+                "(pip install playwright && playwright install chromium)"
+            ) from e
+        self._playwright_error = PlaywrightError
         
-        # GitHubにアクセスしやすくするためのヘッダー設定
-        self.page.set_extra_http_headers({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        # 起動途中で失敗した場合も、それまでに開いたリソースを閉じる
+        try:
+            if self.max_age > 0:
+                self.cache = diskcache.Cache(self.cache_dir)
+                # 期限切れのエントリを削除して、キャッシュが増え続けないようにする
+                self.cache.expire()
+            self._open_output()
+            
+            # ライセンスファイルの存在確認用（HEADリクエストのみ）
+            # ブラウザと同じプロキシ・User-Agentを使う
+            for proxy in self.proxies or [None]:
+                self.http_clients.append(httpx.AsyncClient(
+                    headers={"User-Agent": self.USER_AGENT},
+                    proxy=proxy,
+                    follow_redirects=True,
+                    timeout=10.0
+                ))
+            
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless, 
+                slow_mo=self.slow_mo,
+                args=self.LAUNCH_ARGS,
+                ignore_default_args=["--enable-automation"]
+            )
+            
+            # ページで共有するコンテキスト（GitHubにアクセスしやすくするためUser-Agentを設定）
+            # プロキシを指定した場合はプロキシごとにコンテキストを作成
+            for proxy in self.proxies or [None]:
+                context = await self.browser.new_context(
+                    user_agent=self.USER_AGENT,
+                    viewport=self.VIEWPORT,
+                    proxy={"server": proxy} if proxy else None
+                )
+                await context.route("**/*", self._block_resources)
+                self.contexts.append(context)
+            
+            # 並列取得用のページプールを事前に用意
+            # コンテキストを交互に並べ、リクエストが各プロキシへ順番に振り分けられるようにする
+            # 各プロキシの同時アクセス数はそのコンテキストのページ数（concurrency）までになる
+            self.page_queue = asyncio.Queue()
+            for _ in range(self.concurrency):
+                for context, http_client in zip(self.contexts, self.http_clients):
+                    page = await context.new_page()
+                    self.pages.append(page)
+                    self._page_clients[page] = http_client
+                    self.page_queue.put_nowait(page)
+        except BaseException:
+            await self.__aexit__(*sys.exc_info())
+            raise
         
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """コンテキストマネージャーのエグジット"""
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """非同期コンテキストマネージャーのエグジット"""
+        for context in self.contexts:
+            await context.close()
         if self.browser:
-            self.browser.close()
+            await self.browser.close()
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
+        for http_client in self.http_clients:
+            await http_client.aclose()
+        if self.cache is not None:
+            self.cache.close()
+        self._close_output()
+    
+    async def _block_resources(self, route):
+        """画像・フォント・CSS・計測ビーコンへのリクエストを中断"""
+        request = route.request
+        if (request.resource_type in self.BLOCKED_RESOURCE_TYPES
+                or request.url.startswith(self.BLOCKED_URL_PREFIXES)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @asynccontextmanager
+    async def _borrow_page(self) -> AsyncIterator[Page]:
+        """ページプールからページを借り、使用後に返却する"""
+        page = await self.page_queue.get()
+        try:
+            yield page
+        finally:
+            self.page_queue.put_nowait(page)
     
-    def search_repositories(self, keyword: str, sort: str = "stars", count: int = 10) -> List[Dict]:
+    async def search_repositories(self, keyword: str, sort: str = "stars", count: int = 10) -> List[Dict]:
         """
         指定したキーワードでリポジトリを検索
         
@@ -60,57 +392,151 @@ class GitHubLicenseChecker:
         search_url = f"https://github.com/search?q={quote(keyword)}&type=repositories&s={sort}&o=desc"
         
         try:
-            self.page.goto(search_url, wait_until="networkidle")
-            time.sleep(2)  # ページの完全な読み込みを待機
+            async with self._borrow_page() as page:
+                await page.goto(search_url, wait_until="domcontentloaded")
+                
+                # 検索結果ページに埋め込まれたJSONがあれば、描画を待たずにリポジトリ一覧を取得
+                embedded = await page.evaluate(_EMBEDDED_DATA_JS)
+                results = self._embedded_results(embedded)
+                if results is not None:
+                    targets = self._parse_embedded_results(results[:count])
+                else:
+                    await page.wait_for_selector('[data-testid="results-list"]', timeout=5000)
+                    targets = await self._collect_search_links(page, count)
             
-            repositories = []
+        except Exception as e:
+            print(f"検索エラー: {e}")
+            return []
+        
+        # リポジトリの詳細情報を並列に取得
+        tasks = [
+            asyncio.create_task(self._fetch_repository(i, len(targets), repo_url, repo_full_name))
+            for i, (repo_url, repo_full_name) in enumerate(targets)
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        repositories = []
+        for (_, repo_full_name), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                print(f"リポジトリ情報の取得でエラー ({repo_full_name}): {result}")
+            elif result:
+                repositories.append(result)
+        
+        return repositories
+    
+    async def _collect_search_links(self, page: Page, count: int) -> List[Tuple[str, str]]:
+        """検索結果ページのDOMからリポジトリのURLとフルネームを取得"""
+        # 検索結果のリポジトリ名とURLを1回の呼び出しでまとめて取得
+        rows = await page.eval_on_selector_all('.search-title a[href^="/"]', _SEARCH_LINKS_JS)
+        
+        links = []
+        for row in rows[:count]:
+            repo_url = row["href"]
+            repo_full_name = row["name"]
             
-            # 検索結果のリポジトリ要素を取得
-            repo_elements = self.page.query_selector_all('[data-testid="results-list"] .search-title')
+            if not repo_url or not repo_full_name:
+                continue
             
-            for i, element in enumerate(repo_elements[:count]):
-                try:
-                    # リポジトリ名とURLを取得
-                    link_element = element.query_selector('a')
-                    if not link_element:
-                        continue
-                    
-                    repo_url = link_element.get_attribute('href')
-                    repo_full_name = link_element.inner_text().strip()
-                    
-                    if not repo_url or not repo_full_name:
-                        continue
-                    
-                    # 完全なURLに変換
-                    if repo_url.startswith('/'):
-                        repo_url = f"https://github.com{repo_url}"
-                    
-                    print(f"({i+1}/{min(count, len(repo_elements))}) {repo_full_name} を処理中...")
-                    
-                    # リポジトリの詳細情報を取得
-                    repo_info = self._get_repository_details(repo_url, repo_full_name)
-                    
-                    if repo_info:
-                        repositories.append(repo_info)
-                    
-                    # レート制限を避けるため待機
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"リポジトリ情報の取得でエラー: {e}")
-                    continue
+            # 完全なURLに変換
+            links.append((f"https://github.com{repo_url}", repo_full_name))
+        
+        return links
+    
+    def _embedded_results(self, embedded) -> Optional[List[Dict]]:
+        """埋め込みJSONから検索結果の配列を取り出す（想定外の形式ならNoneを返しDOMから取得させる）"""
+        payload = embedded.get("payload") if isinstance(embedded, dict) else None
+        results = payload.get("results") if isinstance(payload, dict) else None
+        return results if isinstance(results, list) else None
+    
+    def _parse_embedded_results(self, results: List[Dict]) -> List[Tuple[str, str]]:
+        """
+        埋め込みJSONの検索結果からリポジトリのURLとフルネームを取得
+        
+        埋め込みJSONにはライセンスやフォーク数が含まれないため、
+        詳細情報はリポジトリページから取得する
+        """
+        links = []
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            repository = (result.get("repo") or {}).get("repository") or {}
+            if repository.get("owner_login") and repository.get("name"):
+                repo_full_name = f"{repository['owner_login']}/{repository['name']}"
+            else:
+                repo_full_name = _TAG_RE.sub('', result.get("hl_name") or "").strip()
+            if not repo_full_name:
+                continue
             
-            return repositories
+            links.append((f"https://github.com/{repo_full_name}", repo_full_name))
+        
+        return links
+    
+    async def _fetch_repository(self, index: int, total: int, repo_url: str, repo_full_name: str) -> Optional[Dict]:
+        """リポジトリ詳細を取得（同じ実行中に取得済み・取得中であればその結果を共有）"""
+        task = self._repo_cache.get(repo_url)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_repository(index, total, repo_url, repo_full_name)
+            )
+            self._repo_cache[repo_url] = task
+        else:
+            print(f"({index+1}/{total}) {repo_full_name} は取得済み")
+        
+        try:
+            result = await task
+        except BaseException:
+            self._forget_repository(repo_url, task)
+            raise
+        
+        # 取得できなかったリポジトリは次回再試行する
+        if result is None:
+            self._forget_repository(repo_url, task)
+        return result
+    
+    def _forget_repository(self, repo_url: str, task: asyncio.Task):
+        """実行中のキャッシュからリポジトリを削除"""
+        if self._repo_cache.get(repo_url) is task:
+            del self._repo_cache[repo_url]
+    
+    async def _load_repository(self, index: int, total: int, repo_url: str, repo_full_name: str) -> Optional[Dict]:
+        """ページプールからページを借りてリポジトリ詳細を取得"""
+        cached = self._load_cached(repo_url)
+        if cached is not None:
+            print(f"({index+1}/{total}) {repo_full_name} をキャッシュから取得")
+            self._write_result(cached)
+            return cached
+        
+        async with self._borrow_page() as page:
+            print(f"({index+1}/{total}) {repo_full_name} を処理中...")
+            repo_info = await self._get_repository_details(page, repo_url, repo_full_name)
+            if repo_info:
+                # ライセンスを確認できなかった結果はキャッシュせず、次回再取得する
+                if repo_info["license"]["key"] != "error":
+                    self._store_cached(repo_url, repo_info)
+                self._write_result(repo_info)
             
-        except Exception as e:
-            print(f"検索エラー: {e}")
-            return []
+            # レート制限を避けるため待機
+            await asyncio.sleep(1)
+            
+            return repo_info
     
-    def _get_repository_details(self, repo_url: str, repo_full_name: str) -> Optional[Dict]:
+    def _load_cached(self, repo_url: str) -> Optional[Dict]:
+        """有効期限内のキャッシュがあれば返す"""
+        if self.cache is None:
+            return None
+        return self.cache.get(repo_url)
+    
+    def _store_cached(self, repo_url: str, repo_info: Dict):
+        """取得結果をキャッシュに保存（max_age 秒後にdiskcacheが自動で削除）"""
+        if self.cache is not None:
+            self.cache.set(repo_url, repo_info, expire=self.max_age)
+    
+    async def _get_repository_details(self, page: Page, repo_url: str, repo_full_name: str) -> Optional[Dict]:
         """
         個別のリポジトリページから詳細情報を取得
         
         Args:
+            page: 使用するページ
             repo_url: リポジトリURL
             repo_full_name: リポジトリのフルネーム
         
@@ -119,203 +545,338 @@ class GitHubLicenseChecker:
         """
         try:
             # リポジトリページに移動
-            self.page.goto(repo_url, wait_until="networkidle")
-            time.sleep(1)
+            await page.goto(repo_url, wait_until="domcontentloaded")
+            await page.wait_for_selector('#repo-stars-counter-star', timeout=5000)
+            
+            # 基本情報を1回の呼び出しでまとめて取得
+            raw = await page.evaluate(_REPOSITORY_JS, self.SELECTORS)
+            
+            # ライセンス表示がなければライセンスファイルの有無を確認
+            license_file = None
+            license_error = False
+            if not raw["license"]:
+                try:
+                    license_file = await self._find_license_file(self._page_clients[page], repo_url)
+                except httpx.HTTPError as e:
+                    print(f"ライセンスファイル確認エラー ({repo_full_name}): {e}")
+                    license_error = True
             
-            # 基本情報を取得
             repo_info = {
                 "repository": repo_full_name,
                 "url": repo_url,
-                "description": self._get_description(),
-                "language": self._get_primary_language(),
-                "stars": self._get_stars_count(),
-                "forks": self._get_forks_count(),
-                "license": self._get_license_info()
+                "description": raw["description"] or "No description",
+                "language": self._parse_language(raw["language"]),
+                "stars": self._parse_count(raw["stars"]),
+                "forks": self._parse_count(raw["forks"]),
+                "license": (
+                    {"name": "Error", "key": "error", "url": ""} if license_error
+                    else self._parse_license(repo_url, raw["license"], license_file)
+                )
             }
             
             return repo_info
             
-        except Exception as e:
+        except self._playwright_error as e:
             print(f"リポジトリ詳細取得エラー ({repo_full_name}): {e}")
             return None
     
-    def _get_description(self) -> str:
-        """リポジトリの説明を取得"""
-        try:
-            desc_element = self.page.query_selector('[data-pjax="#repo-content-pjax-container"] p')
-            if desc_element:
-                return desc_element.inner_text().strip()
-        except:
-            pass
-        return "No description"
+    def _parse_language(self, language: Dict) -> str:
+        """言語の統計ラベルまたは表示テキストから主要言語を取得"""
+        # 言語の統計バーから主要言語を取得
+        if language["label"]:
+            match = _LANG_RE.match(language["label"])
+            if match:
+                return match.group(1).strip()
+        
+        # 別の方法で言語を取得
+        return language["text"] or "Unknown"
     
-    def _get_primary_language(self) -> str:
-        """主要言語を取得"""
+    def _parse_count(self, count_text: str) -> int:
+        """数値文字列を解析（1.2k -> 1200等）"""
+        if not count_text:
+            return 0
+        
+        # 末尾の1文字だけを見て倍率を決める
+        text = count_text.strip().lower().replace(',', '')
+        mult = _MULT.get(text[-1:], 1)
+        number = text[:-1] if mult != 1 else text
+        
         try:
-            # 言語の統計バーから主要言語を取得
-            lang_element = self.page.query_selector('[data-view-component="true"] .Progress-item')
-            if lang_element:
-                aria_label = lang_element.get_attribute('aria-label')
-                if aria_label:
-                    # "Python 85.2%" のような形式から言語名を抽出
-                    match = re.match(r'^([^0-9]+)', aria_label)
-                    if match:
-                        return match.group(1).strip()
+            return int(float(number) * mult)
+        except (ValueError, OverflowError):
+            return 0
+    
+    async def _find_license_file(self, http_client: httpx.AsyncClient, repo_url: str) -> Optional[str]:
+        """
+        raw.githubusercontent.com へのHEADリクエストでライセンスファイルを探す
+        
+        Args:
+            http_client: 使用するHTTPクライアント（リポジトリページを開いたページと同じプロキシ）
+            repo_url: リポジトリURL
+        
+        Returns:
+            見つかったライセンスファイル名（候補順で最初のもの）。すべて404ならNone
+        
+        Raises:
+            httpx.HTTPError: ファイルが見つからず、404以外の応答や通信エラーがあった場合
+        """
+        repo_path = urlparse(repo_url).path.strip('/')
+        responses = await asyncio.gather(*[
+            http_client.head(f"{self.RAW_URL}/{repo_path}/HEAD/{license_file}")
+            for license_file in self.LICENSE_FILES
+        ], return_exceptions=True)
+        
+        for license_file, response in zip(self.LICENSE_FILES, responses):
+            if isinstance(response, httpx.Response) and response.status_code == 200:
+                return license_file
+        
+        # 「すべて404」と「確認に失敗した」を区別する
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+            if response.status_code != 404:
+                raise httpx.HTTPStatusError(
+                    f"Unexpected status {response.status_code}",
+                    request=response.request, response=response
+                )
+        return None
+    
+    def _parse_license(self, repo_url: str, found: Optional[Dict], license_file: Optional[str] = None) -> Dict:
+        """ページから取得したライセンス情報を結果の形式に変換"""
+        if found:
+            return {
+                "name": found["text"],
+                "key": found["text"].lower().replace(' ', '-'),
+                "url": found["href"]
+            }
+        if license_file:
+            return {
+                "name": "License file found",
+                "key": "license-file",
+                "url": f"{repo_url}/blob/HEAD/{license_file}"
+            }
+        
+        return {"name": "No License", "key": "no-license", "url": ""}
+
+class RateLimiter:
+    """GitHub APIのレート制限に合わせてトークンのローテーションと待機を行うクラス"""
+    
+    # 残り回数がこれを下回ったトークンはリセットまで使わない
+    MIN_REMAINING = 5
+    MAX_RETRIES = 3
+    
+    def __init__(self, tokens: Optional[List[str]] = None):
+        """
+        Args:
+            tokens: 使用するアクセストークンのリスト（空の場合は未認証でアクセス）
+        """
+        self.tokens = deque(tokens or [None])
+        self.exhausted_until: Dict[Optional[str], float] = {}
+    
+    async def acquire(self) -> Optional[str]:
+        """使用可能なトークンを返す（すべて上限に達していればリセットまで待機）"""
+        while True:
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = self.tokens[0]
+                if self.exhausted_until.get(token, 0) <= now:
+                    return token
+                self.tokens.rotate(-1)
             
-            # 別の方法で言語を取得
-            lang_span = self.page.query_selector('[data-view-component="true"] .ml-0 .color-fg-default')
-            if lang_span:
-                return lang_span.inner_text().strip()
-                
-        except:
-            pass
-        return "Unknown"
+            wait = min(self.exhausted_until.values()) - now + 1
+            print(f"レート制限に達したため {wait:.0f} 秒待機します...")
+            await asyncio.sleep(wait)
     
-    def _get_stars_count(self) -> int:
-        """スター数を取得"""
+    def record(self, token: Optional[str], response: httpx.Response):
+        """レスポンスヘッダーからトークンの残り回数を記録"""
         try:
-            # スターボタンを探す
-            star_selectors = [
-                '#repo-stars-counter-star',
-                '[data-view-component="true"] #repo-stars-counter-star',
-                'a[href$="/stargazers"] strong',
-                '.js-social-count'
-            ]
-            
-            for selector in star_selectors:
-                element = self.page.query_selector(selector)
-                if element:
-                    text = element.inner_text().strip()
-                    return self._parse_count(text)
-                    
-        except:
-            pass
-        return 0
+            remaining = int(response.headers["x-ratelimit-remaining"])
+            reset = float(response.headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        
+        if remaining < self.MIN_REMAINING:
+            self.exhausted_until[token] = reset
+            if self.tokens[0] == token:
+                self.tokens.rotate(-1)
     
-    def _get_forks_count(self) -> int:
-        """フォーク数を取得"""
+    def _retry_after_seconds(self, value: str) -> Optional[float]:
+        """Retry-After ヘッダー（秒数またはHTTP日付）を待機秒数に変換"""
         try:
-            # フォークボタンを探す
-            fork_selectors = [
-                '#repo-network-counter',
-                '[data-view-component="true"] #repo-network-counter',
-                'a[href$="/forks"] strong'
-            ]
-            
-            for selector in fork_selectors:
-                element = self.page.query_selector(selector)
-                if element:
-                    text = element.inner_text().strip()
-                    return self._parse_count(text)
-                    
-        except:
+            return max(0.0, float(int(value)))
+        except ValueError:
             pass
-        return 0
-    
-    def _parse_count(self, count_text: str) -> int:
-        """数値文字列を解析（1.2k -> 1200等）"""
-        if not count_text:
-            return 0
-            
-        count_text = count_text.lower().replace(',', '')
         
         try:
-            if 'k' in count_text:
-                return int(float(count_text.replace('k', '')) * 1000)
-            elif 'm' in count_text:
-                return int(float(count_text.replace('m', '')) * 1000000)
-            else:
-                return int(count_text)
-        except:
-            return 0
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
     
-    def _get_license_info(self) -> Dict:
-        """ライセンス情報を取得"""
-        try:
-            # ライセンス情報を探す複数のセレクター
-            license_selectors = [
-                '[data-view-component="true"] .Link--muted[href*="license"]',
-                '.octicon-law + .Link--muted',
-                'a[href$="/blob/main/LICENSE"]',
-                'a[href$="/blob/master/LICENSE"]',
-                '.BorderGrid-cell .octicon-law + *'
-            ]
-            
-            for selector in license_selectors:
-                element = self.page.query_selector(selector)
-                if element:
-                    license_text = element.inner_text().strip()
-                    if license_text and license_text != "View license":
-                        return {
-                            "name": license_text,
-                            "key": license_text.lower().replace(' ', '-'),
-                            "url": element.get_attribute('href') or ""
-                        }
-            
-            # ライセンスファイルの存在確認
-            license_files = ['LICENSE', 'LICENSE.md', 'LICENSE.txt', 'COPYING']
-            for license_file in license_files:
-                if self.page.query_selector(f'a[title="{license_file}"]'):
-                    return {
-                        "name": "License file found",
-                        "key": "license-file",
-                        "url": f"{self.page.url}/blob/main/{license_file}"
-                    }
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        レート制限を考慮してリクエストを送信
+        
+        レート制限による応答（429、Retry-After 付き、または残り回数0）の場合は
+        Retry-After、リセット時刻、指数バックオフの順に従って最大 MAX_RETRIES 回まで
+        再試行する。権限エラーなどその他の403はそのまま返す
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            token = await self.acquire()
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            response = await client.request(method, url, headers=headers, **kwargs)
+            self.record(token, response)
             
-            return {"name": "No License", "key": "no-license", "url": ""}
+            retry_after = response.headers.get("retry-after")
+            rate_limited = (
+                response.status_code == 429
+                or retry_after is not None
+                or response.headers.get("x-ratelimit-remaining") == "0"
+            )
+            if not rate_limited or attempt == self.MAX_RETRIES:
+                return response
             
-        except Exception as e:
-            print(f"ライセンス取得エラー: {e}")
-            return {"name": "Error", "key": "error", "url": ""}
+            delay = self._retry_after_seconds(retry_after) if retry_after else None
+            if delay is not None:
+                await asyncio.sleep(delay)
+            elif self.exhausted_until.get(token, 0) <= time.time():
+                # リセット時刻が分からない場合は指数バックオフ（分かる場合は acquire で待機）
+                await asyncio.sleep(2 ** attempt)
+        
+        return response
+
+class APIGitHubLicenseChecker(BaseLicenseChecker):
+    label = "API版"
+    report_filename = "github_license_report_api.json"
     
-    def check_repositories_licenses(self, keyword: str, count: int = 10, sort: str = "stars") -> List[Dict]:
+    API_URL = "https://api.github.com"
+    
+    def __init__(self, token: Optional[str] = None, tokens: Optional[List[str]] = None,
+                 output: Optional[str] = None):
         """
-        キーワードで検索したリポジトリのライセンスをチェック
+        GitHub REST APIでリポジトリのライセンスをチェックするクラス
+        
+        Args:
+            token: GitHubのアクセストークン（省略時は環境変数 GITHUB_TOKEN）
+            tokens: ローテーションして使うアクセストークンのリスト
+                    （省略時は環境変数 GITHUB_TOKENS のカンマ区切り）
+            output: 取得した結果を1件ずつ書き出すJSONLファイル（実行ごとに上書き）
+        """
+        super().__init__(output)
+        if tokens is None:
+            tokens = [t for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t]
+        token = token or os.environ.get("GITHUB_TOKEN")
+        if token and token not in tokens:
+            tokens = [token, *tokens]
+        
+        self.rate_limiter = RateLimiter(tokens)
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        """非同期コンテキストマネージャーのエントリ"""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28"
+        }
+        
+        self.client = httpx.AsyncClient(
+            base_url=self.API_URL,
+            headers=headers,
+            http2=True,
+            timeout=30.0
+        )
+        self._open_output()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """非同期コンテキストマネージャーのエグジット"""
+        if self.client:
+            await self.client.aclose()
+        self._close_output()
+    
+    async def search_repositories(self, keyword: str, sort: str = "stars", count: int = 10) -> List[Dict]:
+        """
+        指定したキーワードでリポジトリを検索
+        
+        検索APIのレスポンスに必要な情報がすべて含まれるため、
+        リポジトリごとの追加リクエストは行わない
         
         Args:
             keyword: 検索キーワード
-            count: チェックするリポジトリ数
-            sort: ソート方法
+            sort: ソート方法 ('stars', 'forks', 'updated', 'best-match')
+            count: 取得するリポジトリ数
         
         Returns:
-            リポジトリとライセンス情報のリスト
+            リポジトリ情報のリスト
         """
-        return self.search_repositories(keyword, sort, count)
-    
-    def display_results(self, results: List[Dict]):
-        """結果を見やすく表示"""
-        if not results:
-            print("表示する結果がありません。")
-            return
+        print(f"'{keyword}'でリポジトリを検索中...")
         
-        print("\n" + "="*80)
-        print("GitHub リポジトリ ライセンス チェック結果 (Playwright版)")
-        print("="*80)
+        params = {"q": keyword, "per_page": min(count, 100)}
+        if sort != "best-match":
+            params["sort"] = sort
+            params["order"] = "desc"
         
-        for i, result in enumerate(results, 1):
-            print(f"\n{i}. {result['repository']}")
-            print(f"   説明: {result['description'][:100]}{'...' if len(result['description']) > 100 else ''}")
-            print(f"   言語: {result['language']}")
-            print(f"   スター: {result['stars']:,} | フォーク: {result['forks']:,}")
-            print(f"   ライセンス: {result['license']['name']}")
-            print(f"   URL: {result['url']}")
+        repositories = []
+        page_number = 1
+        
+        try:
+            while len(repositories) < count:
+                params["page"] = page_number
+                response = await self.rate_limiter.request(
+                    self.client, "GET", "/search/repositories", params=params
+                )
+                response.raise_for_status()
+                
+                items = response.json().get("items", [])
+                for item in items[:count - len(repositories)]:
+                    repo_info = self._to_repo_info(item)
+                    repositories.append(repo_info)
+                    self._write_result(repo_info)
+                
+                if len(items) < params["per_page"]:
+                    break
+                page_number += 1
             
-            if result['license']['key'] == 'no-license':
-                print("   ⚠️  ライセンスが設定されていません")
-            elif result['license']['key'] == 'error':
-                print("   ❌ ライセンス情報の取得に失敗しました")
+            return repositories
+            
+        except httpx.HTTPError as e:
+            print(f"検索エラー: {e}")
+            return repositories
     
-    def export_to_json(self, results: List[Dict], filename: str = "github_license_report_playwright.json"):
-        """結果をJSONファイルに出力"""
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
-            print(f"\n結果を {filename} に保存しました。")
-        except Exception as e:
-            print(f"ファイル保存エラー: {e}")
+    def _to_repo_info(self, item: Dict) -> Dict:
+        """REST APIのリポジトリJSONを結果の辞書に変換"""
+        return {
+            "repository": item["full_name"],
+            "url": item["html_url"],
+            "description": item.get("description") or "No description",
+            "language": item.get("language") or "Unknown",
+            "stars": item.get("stargazers_count", 0),
+            "forks": item.get("forks_count", 0),
+            "license": self._to_license_info(item.get("license"))
+        }
+    
+    def _to_license_info(self, license_data: Optional[Dict]) -> Dict:
+        """APIのライセンス情報を結果の形式に変換"""
+        if not license_data:
+            return {"name": "No License", "key": "no-license", "url": ""}
+        return {
+            "name": license_data.get("name") or "Unknown",
+            "key": license_data.get("key") or "other",
+            "url": license_data.get("url") or ""
+        }
 
-def main():
-    print("GitHub Repository License Checker (Playwright版)")
+def jsonl_to_json(source: str, destination: str):
+    """JSONLで出力した結果を従来のJSON配列形式に変換"""
+    with open(source, encoding='utf-8') as f:
+        results = [json.loads(line) for line in f if line.strip()]
+    with open(destination, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+async def interactive_main():
+    """対話形式で1つのキーワードをチェック"""
+    print("GitHub Repository License Checker")
     print("=" * 50)
     
     keyword = input("検索キーワードを入力してください: ")
@@ -337,12 +898,18 @@ def main():
     sort_choice = input("選択 (1-4): ") or "1"
     sort_method = sort_options.get(sort_choice, "stars")
     
-    headless_choice = input("\nヘッドレスモードで実行しますか？ (Y/n): ").lower()
-    headless = headless_choice != 'n'
+    api_choice = input("\nGitHub APIを使用しますか？ (y/N): ").lower()
+    if api_choice == 'y':
+        checker = APIGitHubLicenseChecker()
+    else:
+        headless_choice = input("\nヘッドレスモードで実行しますか？ (Y/n): ").lower()
+        headless = headless_choice != 'n'
+        # ブラウザを表示するデバッグ時のみ操作をゆっくり実行
+        checker = GitHubLicenseChecker(headless=headless, slow_mo=0 if headless else 100)
     
     # ライセンスチェック実行
-    with GitHubLicenseChecker(headless=headless, slow_mo=100) as checker:
-        results = checker.check_repositories_licenses(keyword, count, sort_method)
+    async with checker:
+        results = await checker.check_repositories_licenses(keyword, count, sort_method)
         
         # 結果表示
         checker.display_results(results)
@@ -353,5 +920,98 @@ def main():
             if save_json.lower() == 'y':
                 checker.export_to_json(results)
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="GitHub Repository License Checker")
+    parser.add_argument("keywords", nargs="*", help="検索キーワード")
+    parser.add_argument("--keywords-file", help="検索キーワードを1行に1つずつ記載したファイル")
+    parser.add_argument("--count", type=int, default=10, help="キーワードごとにチェックするリポジトリ数 (デフォルト: 10)")
+    parser.add_argument("--sort", choices=["stars", "forks", "updated", "best-match"], default="stars",
+                        help="ソート方法 (デフォルト: stars)")
+    parser.add_argument("--concurrency", type=int, help="並列に開くページ数 (デフォルト: 5)")
+    parser.add_argument("--output", help="結果を1件ずつ書き出すJSONLファイル（実行ごとに上書き）")
+    parser.add_argument("--json-output", help="実行後に --output のJSONLをJSON配列形式に変換して保存するファイル")
+    parser.add_argument("--api", action="store_true", help="ブラウザを使わずGitHub APIで取得する")
+    parser.add_argument("--headed", action="store_true", help="ブラウザを表示して実行する（デバッグ用）")
+    parser.add_argument("--proxy", action="append", dest="proxies", help="使用するプロキシサーバー（複数指定可）")
+    parser.add_argument("--interactive", action="store_true", help="対話形式で実行する")
+    
+    args = parser.parse_args(argv)
+    if not args.interactive and not args.keywords and not args.keywords_file:
+        parser.error("キーワードまたは --keywords-file を指定してください（対話形式は --interactive）")
+    
+    if args.json_output and not args.output:
+        parser.error("--json-output は --output と同時に指定してください")
+    
+    # ブラウザ専用のオプションはAPI版では使えない
+    if args.api:
+        browser_only = [
+            option for option, value in [
+                ("--concurrency", args.concurrency is not None),
+                ("--headed", args.headed),
+                ("--proxy", bool(args.proxies)),
+            ] if value
+        ]
+        if browser_only:
+            parser.error(f"{', '.join(browser_only)} は --api と同時に指定できません")
+    if args.concurrency is None:
+        args.concurrency = 5
+    return args
+
+def load_keywords(args: argparse.Namespace) -> List[str]:
+    """引数とキーワードファイルから検索キーワードを読み込む（空行と#で始まる行は無視）"""
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        with open(args.keywords_file, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    keywords.append(line)
+    return keywords
+
+async def batch_main(args: argparse.Namespace):
+    """複数のキーワードを1つのチェッカーでまとめてチェック"""
+    keywords = load_keywords(args)
+    
+    if args.api:
+        checker = APIGitHubLicenseChecker(output=args.output)
+    else:
+        # ブラウザを表示するデバッグ時のみ操作をゆっくり実行
+        checker = GitHubLicenseChecker(
+            headless=not args.headed,
+            slow_mo=100 if args.headed else 0,
+            concurrency=args.concurrency,
+            output=args.output,
+            proxies=args.proxies
+        )
+    
+    # ブラウザの起動は1回だけにし、全キーワードを並列に処理
+    async with checker:
+        all_results = await asyncio.gather(*[
+            checker.check_repositories_licenses(keyword, args.count, args.sort)
+            for keyword in keywords
+        ], return_exceptions=True)
+    
+    # 失敗したキーワードがあっても他のキーワードの結果は表示する
+    for keyword, results in zip(keywords, all_results):
+        print(f"\n検索キーワード: {keyword}")
+        if isinstance(results, BaseException):
+            print(f"検索エラー: {results}")
+            continue
+        checker.display_results(results)
+    
+    if args.output:
+        print(f"\n結果を {args.output} に保存しました。")
+    if args.json_output:
+        jsonl_to_json(args.output, args.json_output)
+        print(f"結果を {args.json_output} に保存しました。")
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.interactive:
+        asyncio.run(interactive_main())
+    else:
+        asyncio.run(batch_main(args))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,196 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+import main
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """asyncio.sleep を待たずに記録だけするよう差し替える"""
+    calls = []
+
+    async def fake_sleep(delay):
+        calls.append(delay)
+
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+    return calls
+
+
+def run_request(limiter, responses):
+    """順番に responses を返すモックに対して RateLimiter.request を実行"""
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return responses[min(len(sent), len(responses)) - 1]
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://api.github.com") as client:
+            return await limiter.request(client, "GET", "/search/repositories")
+
+    return asyncio.run(run()), sent
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1.2k", 1200),
+    ("3,456", 3456),
+    ("2M", 2_000_000),
+    ("1.5b", 1_500_000_000),
+    (" 5 k", 5000),
+    ("12", 12),
+    ("", 0),
+    ("abc", 0),
+    ("inf", 0),
+])
+def test_parse_count(text, expected):
+    assert main.GitHubLicenseChecker()._parse_count(text) == expected
+
+
+def test_record_parks_exhausted_token_and_rotates():
+    limiter = main.RateLimiter(["a", "b"])
+    reset = time.time() + 60
+    response = httpx.Response(200, headers={"x-ratelimit-remaining": "3", "x-ratelimit-reset": str(reset)})
+
+    limiter.record("a", response)
+
+    assert limiter.exhausted_until["a"] == reset
+    assert asyncio.run(limiter.acquire()) == "b"
+
+
+def test_record_ignores_malformed_headers():
+    limiter = main.RateLimiter(["a"])
+    limiter.record("a", httpx.Response(200, headers={"x-ratelimit-remaining": "abc", "x-ratelimit-reset": "1"}))
+    assert limiter.exhausted_until == {}
+
+
+def test_acquire_waits_until_earliest_reset(monkeypatch):
+    limiter = main.RateLimiter(["a", "b"])
+    limiter.exhausted_until = {"a": time.time() + 30, "b": time.time() + 60}
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        limiter.exhausted_until["a"] = 0
+
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+
+    assert asyncio.run(limiter.acquire()) == "a"
+    assert len(sleeps) == 1 and 29 <= sleeps[0] <= 31
+
+
+def test_retry_after_seconds():
+    limiter = main.RateLimiter()
+    future = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert limiter._retry_after_seconds("7") == 7
+    assert limiter._retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert 110 <= limiter._retry_after_seconds(format_datetime(future, usegmt=True)) <= 120
+    assert limiter._retry_after_seconds("soon") is None
+
+
+def test_request_sends_bearer_token(sleeps):
+    response, sent = run_request(main.RateLimiter(["secret"]), [httpx.Response(200)])
+    assert response.status_code == 200
+    assert sent[0].headers["Authorization"] == "Bearer secret"
+
+
+def test_request_without_token_sends_no_authorization(sleeps):
+    _, sent = run_request(main.RateLimiter(), [httpx.Response(200)])
+    assert "Authorization" not in sent[0].headers
+
+
+def test_request_retries_429_with_http_date_retry_after(sleeps):
+    responses = [
+        httpx.Response(429, headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        httpx.Response(200),
+    ]
+    response, sent = run_request(main.RateLimiter(), responses)
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert sleeps == [0]
+
+
+def test_request_returns_plain_403_immediately(sleeps):
+    response, sent = run_request(main.RateLimiter(), [httpx.Response(403), httpx.Response(200)])
+
+    assert response.status_code == 403
+    assert len(sent) == 1
+    assert sleeps == []
+
+
+def test_request_backs_off_when_reset_is_unknown(sleeps):
+    responses = [httpx.Response(403, headers={"x-ratelimit-remaining": "0"})]
+    response, sent = run_request(main.RateLimiter(), responses)
+
+    assert response.status_code == 403
+    assert len(sent) == main.RateLimiter.MAX_RETRIES + 1
+    assert sleeps == [1, 2, 4]
+
+
+def test_request_rotates_to_next_token_on_exhaustion(sleeps):
+    reset = str(time.time() + 3600)
+    responses = [
+        httpx.Response(403, headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset}),
+        httpx.Response(200),
+    ]
+    response, sent = run_request(main.RateLimiter(["a", "b"]), responses)
+
+    assert response.status_code == 200
+    assert [r.headers["Authorization"] for r in sent] == ["Bearer a", "Bearer b"]
+    assert sleeps == []
+
+
+def test_parse_args_defaults():
+    args = main.parse_args(["rust"])
+    assert args.keywords == ["rust"]
+    assert args.concurrency == 5
+    assert args.sort == "stars"
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["rust", "--api", "--concurrency", "3"],
+    ["rust", "--api", "--headed"],
+    ["rust", "--api", "--proxy", "http://proxy:8080"],
+    ["rust", "--json-output", "out.json"],
+])
+def test_parse_args_rejects_invalid_combinations(argv):
+    with pytest.raises(SystemExit):
+        main.parse_args(argv)
+
+
+def test_load_keywords_skips_blank_and_comment_lines(tmp_path):
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text("machine learning\n\n# comment\ndeep learning\n", encoding="utf-8")
+
+    args = main.parse_args(["rust", "--keywords-file", str(keywords_file)])
+
+    assert main.load_keywords(args) == ["rust", "machine learning", "deep learning"]
+
+
+def test_embedded_results_rejects_unexpected_shapes():
+    checker = main.GitHubLicenseChecker()
+    assert checker._embedded_results(None) is None
+    assert checker._embedded_results([]) is None
+    assert checker._embedded_results({"payload": {"results": "x"}}) is None
+    assert checker._embedded_results({"payload": {"results": []}}) == []
+
+
+def test_parse_embedded_results():
+    results = [
+        {"hl_name": "<em>micro</em>soft/play", "repo": {"repository": {"owner_login": "microsoft", "name": "playwright"}}},
+        {"hl_name": "psf/<em>requests</em>"},
+        {"hl_name": ""},
+        "unexpected",
+    ]
+
+    assert main.GitHubLicenseChecker()._parse_embedded_results(results) == [
+        ("https://github.com/microsoft/playwright", "microsoft/playwright"),
+        ("https://github.com/psf/requests", "psf/requests"),
+    ]